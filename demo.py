@@ -6,6 +6,7 @@ Run this to see the agent play a single game with visualization
 from game import Game2048
 from expectimax_agent import ExpectimaxAgent
 import time
+from multiprocessing import Pool, cpu_count
 
 def play_demo_game(depth=5, max_moves=500, delay=0.5):
     """
@@ -76,36 +77,41 @@ def play_demo_game(depth=5, max_moves=500, delay=0.5):
     print("="*60)
 
 
+def _run_benchmark_game(game_index):
+    """Play one benchmark game (runs in a worker process)"""
+    agent = ExpectimaxAgent(depth=3)
+    game = Game2048()
+    moves = 0
+
+    while not game.is_game_over() and moves < 1000:
+        move = agent.get_best_move(game)
+        if move is None:
+            break
+        moved, _ = game.move(move)
+        if moved:
+            game.add_random_tile()
+            moves += 1
+
+    return {
+        'score': game.score,
+        'max_tile': game.get_max_tile(),
+        'moves': moves
+    }
+
+
 def quick_benchmark():
-    """Run a quick 5-game benchmark"""
+    """Run a quick 5-game benchmark (games run in parallel)"""
     print("\n" + "="*60)
     print("QUICK BENCHMARK - 5 GAMES")
     print("="*60)
-    
-    agent = ExpectimaxAgent(depth=3)
+
+    # Each game is independent, so run them across worker processes
     results = []
-    
-    for i in range(5):
-        print(f"\nGame {i+1}/5...")
-        game = Game2048()
-        moves = 0
-        
-        while not game.is_game_over() and moves < 1000:
-            move = agent.get_best_move(game)
-            if move is None:
-                break
-            moved, _ = game.move(move)
-            if moved:
-                game.add_random_tile()
-                moves += 1
-        
-        results.append({
-            'score': game.score,
-            'max_tile': game.get_max_tile(),
-            'moves': moves
-        })
-        
-        print(f"  Score: {game.score} | Max Tile: {game.get_max_tile()} | Moves: {moves}")
+    with Pool(processes=min(5, cpu_count())) as pool:
+        for i, result in enumerate(pool.imap(_run_benchmark_game, range(5)), 1):
+            print(f"\nGame {i}/5...")
+            print(f"  Score: {result['score']} | Max Tile: {result['max_tile']} | Moves: {result['moves']}")
+            results.append(result)
     
     # Summary
     avg_score = sum(r['score'] for r in results) / len(results)
@@ -1,25 +1,206 @@
-from game import Game2048
-import math
+from game import Game2048, ROW_MASK, transpose
+import array
+import os
 import time
 import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Precomputed heuristic tables, indexed by a packed 16-bit row.
+#
+# Tile nibbles already store log2(tile), so monotonicity/smoothness deltas
+# are plain integer differences of exponents - no math.log2 anywhere in the
+# hot path. Column contributions reuse the same tables on the transposed
+# board, making the whole evaluation 8 row lookups plus additions.
+# ---------------------------------------------------------------------------
+
+ROW_EMPTY_TABLE = array.array('b', bytes(65536))
+ROW_MAX_TABLE = array.array('b', bytes(65536))
+ROW_MONO_LEFT_TABLE = array.array('d', bytes(8 * 65536))
+ROW_MONO_RIGHT_TABLE = array.array('d', bytes(8 * 65536))
+ROW_SMOOTH_TABLE = array.array('d', bytes(8 * 65536))
+
+
+def _build_heuristic_tables():
+    """Precompute per-row empty/max/monotonicity/smoothness contributions"""
+    for row in range(65536):
+        exps = [(row >> (4 * j)) & 0xF for j in range(4)]
+        ROW_EMPTY_TABLE[row] = exps.count(0)
+        ROW_MAX_TABLE[row] = max(exps)
+
+        mono_left = 0.0
+        mono_right = 0.0
+        smooth = 0.0
+        for j in range(3):
+            a, b = exps[j], exps[j + 1]
+            if a and b:
+                diff = a - b
+                if diff > 0:
+                    mono_left += diff
+                else:
+                    mono_right += -diff
+                smooth -= abs(diff)
+        ROW_MONO_LEFT_TABLE[row] = mono_left
+        ROW_MONO_RIGHT_TABLE[row] = mono_right
+        ROW_SMOOTH_TABLE[row] = smooth
+
+
+_build_heuristic_tables()
+
+# NumPy views of the tables for batched (vectorized) evaluation
+_NP_EMPTY = np.array(ROW_EMPTY_TABLE, dtype=np.int64)
+_NP_MAX = np.array(ROW_MAX_TABLE, dtype=np.int64)
+_NP_MONO_LEFT = np.array(ROW_MONO_LEFT_TABLE, dtype=np.float64)
+_NP_MONO_RIGHT = np.array(ROW_MONO_RIGHT_TABLE, dtype=np.float64)
+_NP_SMOOTH = np.array(ROW_SMOOTH_TABLE, dtype=np.float64)
+
+
+def _transpose_batch(b):
+    """Vectorized bitboard transpose over a uint64 array"""
+    a1 = b & np.uint64(0xF0F00F0FF0F00F0F)
+    a2 = b & np.uint64(0x0000F0F00000F0F0)
+    a3 = b & np.uint64(0x0F0F00000F0F0000)
+    a = a1 | (a2 << np.uint64(12)) | (a3 >> np.uint64(12))
+    b1 = a & np.uint64(0xFF00FF0000FF00FF)
+    b2 = a & np.uint64(0x00FF00FF00000000)
+    b3 = a & np.uint64(0x00000000FF00FF00)
+    return b1 | (b2 >> np.uint64(24)) | (b3 << np.uint64(24))
+
+
+def _evaluate_batch(boards):
+    """
+    Evaluate many packed boards at once, mirroring ExpectimaxAgent._evaluate.
+
+    The table lookups become NumPy gathers and the adaptive weights become
+    np.where selections, amortizing interpreter overhead across the batch.
+    """
+    b = np.array(boards, dtype=np.uint64)
+    t = _transpose_batch(b)
+    mask = np.uint64(0xFFFF)
+    r0 = (b & mask).astype(np.int64)
+    r1 = ((b >> np.uint64(16)) & mask).astype(np.int64)
+    r2 = ((b >> np.uint64(32)) & mask).astype(np.int64)
+    r3 = ((b >> np.uint64(48)) & mask).astype(np.int64)
+    c0 = (t & mask).astype(np.int64)
+    c1 = ((t >> np.uint64(16)) & mask).astype(np.int64)
+    c2 = ((t >> np.uint64(32)) & mask).astype(np.int64)
+    c3 = ((t >> np.uint64(48)) & mask).astype(np.int64)
+
+    empty = _NP_EMPTY[r0] + _NP_EMPTY[r1] + _NP_EMPTY[r2] + _NP_EMPTY[r3]
+    w_empty = np.where(empty > 10, 150000.0,
+                       np.where(empty > 6, 200000.0, 300000.0))
+    w_mono = np.where(empty > 10, 3000.0,
+                      np.where(empty > 6, 8000.0, 15000.0))
+    w_smooth = np.where(empty > 10, 3000.0,
+                        np.where(empty > 6, 2000.0, 1000.0))
+
+    score = w_empty * (empty * empty)
+
+    mono_left = (_NP_MONO_LEFT[r0] + _NP_MONO_LEFT[r1] +
+                 _NP_MONO_LEFT[r2] + _NP_MONO_LEFT[r3])
+    mono_right = (_NP_MONO_RIGHT[r0] + _NP_MONO_RIGHT[r1] +
+                  _NP_MONO_RIGHT[r2] + _NP_MONO_RIGHT[r3])
+    mono_up = (_NP_MONO_LEFT[c0] + _NP_MONO_LEFT[c1] +
+               _NP_MONO_LEFT[c2] + _NP_MONO_LEFT[c3])
+    mono_down = (_NP_MONO_RIGHT[c0] + _NP_MONO_RIGHT[c1] +
+                 _NP_MONO_RIGHT[c2] + _NP_MONO_RIGHT[c3])
+    score += w_mono * (np.maximum(mono_up, mono_down) +
+                       np.maximum(mono_left, mono_right))
+
+    score += w_smooth * (_NP_SMOOTH[r0] + _NP_SMOOTH[r1] +
+                         _NP_SMOOTH[r2] + _NP_SMOOTH[r3] +
+                         _NP_SMOOTH[c0] + _NP_SMOOTH[c1] +
+                         _NP_SMOOTH[c2] + _NP_SMOOTH[c3])
+
+    max_exp = np.maximum(np.maximum(_NP_MAX[r0], _NP_MAX[r1]),
+                         np.maximum(_NP_MAX[r2], _NP_MAX[r3]))
+    score += np.where(max_exp > 0, 2000.0 * max_exp, 0.0)
+
+    nib = np.uint64(0xF)
+    in_corner = ((max_exp == (b & nib).astype(np.int64)) |
+                 (max_exp == ((b >> np.uint64(12)) & nib).astype(np.int64)) |
+                 (max_exp == ((b >> np.uint64(48)) & nib).astype(np.int64)) |
+                 (max_exp == ((b >> np.uint64(60)) & nib).astype(np.int64)))
+    score += np.where(in_corner, 5000.0, 0.0)
+
+    return score
+
+
+def _search_subtree(args):
+    """
+    Worker for the parallel root search: evaluate one root move's chance
+    subtree in a separate process. Builds a throwaway agent so each worker
+    has its own transposition table and RNG.
+    """
+    board, score, depth, prune_four = args
+    agent = ExpectimaxAgent(depth=depth, prune_four=prune_four)
+    game = Game2048.__new__(Game2048)
+    game.size = 4
+    game.board = board
+    game.score = score
+    value = agent._expectimax(game, depth - 1, False)
+    return value, agent.nodes_explored
+
 
 class ExpectimaxAgent:
     """
     Expectimax agent for 2048 with heuristics
     """
-    
-    def __init__(self, depth=5, heuristic_weights=None):
+
+    # Only cache nodes at least this deep; leaves are cheap to recompute
+    # and would bloat the table (mirrors nneonneo's CACHE_DEPTH_LIMIT).
+    CACHE_DEPTH_LIMIT = 2
+
+    def __init__(self, depth=5, heuristic_weights=None, use_numba=False,
+                 time_budget=None, prune_four=True, parallel=False):
         """
         Initialize the Expectimax agent.
-        
+
         Args:
             depth: Maximum search depth (number of plies) - default 5 for good performance
             heuristic_weights: Dict of weights (kept for compatibility, but uses optimized defaults)
+            use_numba: Run the search through the compiled kernel in
+                expectimax_nb (requires numba; falls back to pure Python
+                if the import fails). The compiled path expands chance
+                nodes exactly instead of sampling.
+            time_budget: Optional wall-clock budget per move in seconds.
+                The search deepens iteratively and stops after the first
+                completed iteration past the deadline, keeping its result
+                (anytime behavior). None searches all depths up to `depth`.
+            prune_four: Skip the 10%-probability 4-tile branch at chance
+                nodes deeper than one ply below the root, treating the
+                placement like a 2. Roughly halves deep chance-node work
+                for a negligible accuracy loss.
+            parallel: Search the (up to 4) root subtrees in worker
+                processes. Worth it for deep searches; at shallow depths
+                the process overhead outweighs the subtree cost, so it
+                defaults to off.
         """
         self.depth = depth
+        self.time_budget = time_budget
+        self.prune_four = prune_four
+        # Depth actually used by the current search (set per move)
+        self._search_depth = depth
+        self.parallel = parallel
+        self._executor = None
         self.heuristic_weights = heuristic_weights  # Kept for compatibility
+        self._nb = None
+        if use_numba:
+            try:
+                import expectimax_nb
+                self._nb = expectimax_nb
+            except ImportError:
+                pass
         self.nodes_explored = 0
         self.time_taken = 0
+        # Transposition table: (board, depth, is_max_node) -> utility,
+        # valid for a single search (cleared in get_best_move)
+        self.tt = {}
+        # Dedicated RNG instance: skips the module-level function wrappers
+        # on the hot chance-node sampling path
+        self._rng = random.Random()
     
     def get_best_move(self, game):
         """
@@ -33,27 +214,100 @@ class ExpectimaxAgent:
         """
         start_time = time.time()
         self.nodes_explored = 0
-        
-        available_moves = game.get_available_moves()
-        if not available_moves:
+        self.tt.clear()
+
+        deadline = None if self.time_budget is None else start_time + self.time_budget
+
+        # Adaptive depth (as in nneonneo/2048-ai): shallow while the board
+        # is open and branching is huge, deeper as it fills up and depth
+        # actually matters - capped by the configured maximum
+        empty = game.count_empty()
+        max_depth = max(min(3, self.depth),
+                        min(self.depth, 3 + (16 - empty) // 3))
+        self._search_depth = max_depth
+
+        if self._nb is not None:
+            if deadline is None:
+                # No time budget: deepening buys nothing here (each
+                # nb search builds a fresh transposition table, so the
+                # shallow passes would just be recomputed and discarded)
+                best_move, nodes = self._nb.search(game.board, max_depth)
+                self.nodes_explored += nodes
+            else:
+                best_move = None
+                for d in range(min(2, max_depth), max_depth + 1):
+                    best_move, nodes = self._nb.search(game.board, d)
+                    self.nodes_explored += nodes
+                    if time.time() >= deadline:
+                        break
+            self.time_taken = time.time() - start_time
+            return best_move
+
+        move_results = game.get_move_results()
+        if not move_results:
             return None
-        
+
+        if self.parallel and len(move_results) > 1:
+            # Root parallelization: each legal move's subtree is independent,
+            # so farm them out and do a single full-depth pass (per-process
+            # transposition tables cannot carry deepening results anyway)
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 1))
+            tasks = [(new_board, game.score + points, max_depth, self.prune_four)
+                     for _, new_board, points in move_results]
+            best_move = None
+            best_score = float('-inf')
+            for (move, _, _), (score, nodes) in zip(
+                    move_results, self._executor.map(_search_subtree, tasks)):
+                self.nodes_explored += nodes
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+            self.time_taken = time.time() - start_time
+            return best_move
+
+        # Iterative deepening: start shallow and deepen until the maximum
+        # depth or the deadline. Earlier iterations seed the transposition
+        # table, so each deeper pass mostly pays for the new frontier.
+        best_move = None
+        for d in range(min(2, max_depth), max_depth + 1):
+            best_move = self._search_root(game, move_results, d)
+            if deadline is not None and time.time() >= deadline:
+                break
+
+        self.time_taken = time.time() - start_time
+        return best_move
+
+    def _search_root(self, game, move_results, depth):
+        """
+        Search all root moves to the given depth.
+        Returns the best move direction.
+        """
         best_move = None
         best_score = float('-inf')
-        
-        for move in available_moves:
-            # Simulate the move
-            test_game = game.clone()
-            test_game.move(move)
-            
+
+        # Try the statically best-looking move first so the chosen line
+        # stays stable across iterative-deepening passes (better TT reuse)
+        if len(move_results) > 1:
+            move_results = sorted(move_results,
+                                  key=lambda mr: self._evaluate(mr[1]),
+                                  reverse=True)
+
+        # Search on a single scratch clone; each child board is already
+        # computed by get_move_results, so just swap it in
+        search_game = game.clone()
+        for move, new_board, points in move_results:
+            search_game.board = new_board
+            search_game.score = game.score + points
+
             # Evaluate using expectimax (chance node follows player move)
-            score = self._expectimax(test_game, self.depth - 1, False)
-            
+            score = self._expectimax(search_game, depth - 1, False)
+
             if score > best_score:
                 best_score = score
                 best_move = move
-        
-        self.time_taken = time.time() - start_time
+
         return best_move
     
     def _expectimax(self, game, depth, is_max_node):
@@ -70,36 +324,62 @@ class ExpectimaxAgent:
             Expected utility of this state
         """
         self.nodes_explored += 1
-        
+
         # Terminal conditions
         if depth == 0 or game.is_game_over():
             return self._evaluate(game.board)
-        
+
+        # Transposition table: identical positions are reached through many
+        # different move orders, so reuse their utility when deep enough.
+        cacheable = depth >= self.CACHE_DEPTH_LIMIT
+        if cacheable:
+            key = (game.board, depth, is_max_node)
+            cached = self.tt.get(key)
+            if cached is not None:
+                return cached
+
         if is_max_node:
             # Maximizing node: player chooses best move
-            return self._max_node(game, depth)
+            value = self._max_node(game, depth)
         else:
             # Chance node: random tile placement
-            return self._chance_node(game, depth)
+            value = self._chance_node(game, depth)
+
+        if cacheable:
+            self.tt[key] = value
+        return value
     
     def _max_node(self, game, depth):
         """
         Maximizing node: player tries to maximize score.
         """
         max_score = float('-inf')
-        available_moves = game.get_available_moves()
-        
-        if not available_moves:
+        move_results = game.get_move_results()
+
+        if not move_results:
             return self._evaluate(game.board)
-        
-        for move in available_moves:
-            test_game = game.clone()
-            test_game.move(move)
-            
+
+        # Order children by shallow evaluation so the best line is searched
+        # first; expectimax has no alpha-beta cutoffs, but a stable ordering
+        # keeps transposition-table hits high across deepening passes
+        if len(move_results) > 1:
+            move_results.sort(key=lambda mr: self._evaluate(mr[1]),
+                              reverse=True)
+
+        # Swap each precomputed child board in and restore afterwards,
+        # same try/undo pattern as the chance node
+        saved_board = game.board
+        saved_score = game.score
+        for move, new_board, points in move_results:
+            game.board = new_board
+            game.score = saved_score + points
+
             # After player moves, chance node follows
-            score = self._expectimax(test_game, depth - 1, False)
+            score = self._expectimax(game, depth - 1, False)
             max_score = max(max_score, score)
-        
+
+        game.board = saved_board
+        game.score = saved_score
         return max_score
     
     def _chance_node(self, game, depth):
@@ -116,30 +396,69 @@ class ExpectimaxAgent:
         num_empty = len(empty_cells)
         if num_empty > 10 and depth <= 1:
             # Only sample at very shallow depths with many empty cells
-            sampled_cells = random.sample(empty_cells, min(8, num_empty))
+            num_sampled = min(8, num_empty)
         elif num_empty > 6:
             # Use more cells in mid-game
-            sampled_cells = random.sample(empty_cells, min(num_empty, 6))
+            num_sampled = 6
         else:
             # Use all cells when there aren't many
+            num_sampled = num_empty
+
+        if num_sampled < num_empty:
+            # Partial Fisher-Yates on the freshly built list: shuffle just
+            # the prefix we need instead of allocating via random.sample
+            randint = self._rng.randint
+            for k in range(num_sampled):
+                idx = randint(k, num_empty - 1)
+                empty_cells[k], empty_cells[idx] = empty_cells[idx], empty_cells[k]
+            sampled_cells = empty_cells[:num_sampled]
+        else:
             sampled_cells = empty_cells
         
+        # Deep below the root the 4-tile branch carries only 10% weight;
+        # optionally approximate it by the 2-tile result and halve the work
+        prune_four = self.prune_four and depth < self._search_depth - 1
+
+        # When the children are leaves, batch-evaluate all of them in one
+        # vectorized call instead of recursing board by board
+        if depth == 1:
+            board = game.board
+            boards = []
+            for i, j in sampled_cells:
+                shift = 4 * (4 * i + j)
+                boards.append(board | (1 << shift))  # place a 2
+                if not prune_four:
+                    boards.append(board | (2 << shift))  # place a 4
+            scores = _evaluate_batch(boards)
+            self.nodes_explored += len(boards)
+            if prune_four:
+                expected = scores.sum()
+            else:
+                expected = 0.9 * scores[0::2].sum() + 0.1 * scores[1::2].sum()
+            return expected / len(sampled_cells)
+
         expected_score = 0
-        
-        # For each cell, calculate expected value
+
+        # For each cell, calculate expected value. The tile is placed
+        # in-place and undone afterwards instead of cloning the game:
+        # _expectimax never retains the board across its return, so a
+        # set/restore pair is equivalent and avoids two copies per cell.
         for i, j in sampled_cells:
             # Try placing a 2 (90% probability)
-            test_game = game.clone()
-            test_game.board[i][j] = 2
-            score_2 = self._expectimax(test_game, depth - 1, True)
-            
-            # Try placing a 4 (10% probability)
-            test_game = game.clone()
-            test_game.board[i][j] = 4
-            score_4 = self._expectimax(test_game, depth - 1, True)
-            
-            # Expected value for this cell
-            cell_expected = 0.9 * score_2 + 0.1 * score_4
+            game.set_tile(i, j, 2)
+            score_2 = self._expectimax(game, depth - 1, True)
+
+            if prune_four:
+                cell_expected = score_2
+            else:
+                # Try placing a 4 (10% probability)
+                game.set_tile(i, j, 4)
+                score_4 = self._expectimax(game, depth - 1, True)
+
+                # Expected value for this cell
+                cell_expected = 0.9 * score_2 + 0.1 * score_4
+
+            game.set_tile(i, j, 0)
             expected_score += cell_expected
         
         # Average over sampled positions
@@ -154,13 +473,24 @@ class ExpectimaxAgent:
         - Late game (few empty cells): prioritize monotonicity
         
         Args:
-            board: 2D list representing the game board
-            
+            board: 64-bit packed game board
+
         Returns:
             Float score (higher is better)
         """
-        empty = sum(1 for row in board for cell in row if cell == 0)
-        
+        t = transpose(board)
+        r0 = board & ROW_MASK
+        r1 = (board >> 16) & ROW_MASK
+        r2 = (board >> 32) & ROW_MASK
+        r3 = (board >> 48) & ROW_MASK
+        c0 = t & ROW_MASK
+        c1 = (t >> 16) & ROW_MASK
+        c2 = (t >> 32) & ROW_MASK
+        c3 = (t >> 48) & ROW_MASK
+
+        empty = (ROW_EMPTY_TABLE[r0] + ROW_EMPTY_TABLE[r1] +
+                 ROW_EMPTY_TABLE[r2] + ROW_EMPTY_TABLE[r3])
+
         # More aggressive adaptive weights
         if empty > 10:
             # Very early game
@@ -177,83 +507,42 @@ class ExpectimaxAgent:
             w_empty = 300000.0
             w_mono = 15000.0
             w_smooth = 1000.0
-        
+
         score = 0.0
-        
+
         # 1. Empty tiles (squared for strong emphasis)
         score += w_empty * (empty ** 2)
-        
-        # 2. Monotonicity (snake pattern)
-        score += w_mono * self._monotonicity(board)
-        
-        # 3. Smoothness (adjacent tile similarity)
-        score += w_smooth * self._smoothness(board)
-        
-        # 4. Max tile value (log scale)
-        max_tile = max(max(row) for row in board)
-        if max_tile > 0:
-            score += 2000.0 * math.log2(max_tile)
-        
+
+        # 2. Monotonicity (snake pattern): best direction per axis
+        mono_left = (ROW_MONO_LEFT_TABLE[r0] + ROW_MONO_LEFT_TABLE[r1] +
+                     ROW_MONO_LEFT_TABLE[r2] + ROW_MONO_LEFT_TABLE[r3])
+        mono_right = (ROW_MONO_RIGHT_TABLE[r0] + ROW_MONO_RIGHT_TABLE[r1] +
+                      ROW_MONO_RIGHT_TABLE[r2] + ROW_MONO_RIGHT_TABLE[r3])
+        mono_up = (ROW_MONO_LEFT_TABLE[c0] + ROW_MONO_LEFT_TABLE[c1] +
+                   ROW_MONO_LEFT_TABLE[c2] + ROW_MONO_LEFT_TABLE[c3])
+        mono_down = (ROW_MONO_RIGHT_TABLE[c0] + ROW_MONO_RIGHT_TABLE[c1] +
+                     ROW_MONO_RIGHT_TABLE[c2] + ROW_MONO_RIGHT_TABLE[c3])
+        score += w_mono * (max(mono_up, mono_down) + max(mono_left, mono_right))
+
+        # 3. Smoothness (adjacent tile similarity, rows + columns)
+        score += w_smooth * (ROW_SMOOTH_TABLE[r0] + ROW_SMOOTH_TABLE[r1] +
+                             ROW_SMOOTH_TABLE[r2] + ROW_SMOOTH_TABLE[r3] +
+                             ROW_SMOOTH_TABLE[c0] + ROW_SMOOTH_TABLE[c1] +
+                             ROW_SMOOTH_TABLE[c2] + ROW_SMOOTH_TABLE[c3])
+
+        # 4. Max tile value (nibbles already store log2)
+        max_exp = max(ROW_MAX_TABLE[r0], ROW_MAX_TABLE[r1],
+                      ROW_MAX_TABLE[r2], ROW_MAX_TABLE[r3])
+        if max_exp > 0:
+            score += 2000.0 * max_exp
+
         # 5. Bonus for high tiles in corners (subtle, not dominating)
-        max_tile = max(max(row) for row in board)
-        corners = [board[0][0], board[0][3], board[3][0], board[3][3]]
-        if max_tile in corners:
+        if max_exp in ((board >> 0) & 0xF, (board >> 12) & 0xF,
+                       (board >> 48) & 0xF, (board >> 60) & 0xF):
             score += 5000.0
-        
+
         return score
     
-    def _monotonicity(self, board):
-        """
-        Calculate monotonicity score.
-        Rewards tiles that increase/decrease consistently in one direction.
-        Uses log values to normalize across different tile magnitudes.
-        """
-        totals = [0.0, 0.0, 0.0, 0.0]  # up, down, left, right
-        
-        for i in range(4):
-            for j in range(3):
-                # Check rows (left/right monotonicity)
-                if board[i][j] > 0 and board[i][j+1] > 0:
-                    diff = math.log2(board[i][j]) - math.log2(board[i][j+1])
-                    if diff > 0:
-                        totals[2] += diff  # Left to right increasing
-                    else:
-                        totals[3] += -diff  # Right to left increasing
-                
-                # Check columns (up/down monotonicity)
-                if board[j][i] > 0 and board[j+1][i] > 0:
-                    diff = math.log2(board[j][i]) - math.log2(board[j+1][i])
-                    if diff > 0:
-                        totals[0] += diff  # Top to bottom increasing
-                    else:
-                        totals[1] += -diff  # Bottom to top increasing
-        
-        # Return best monotonicity direction (snake pattern)
-        return max(totals[0], totals[1]) + max(totals[2], totals[3])
-    
-    def _smoothness(self, board):
-        """
-        Calculate smoothness score.
-        Penalizes large differences between adjacent tiles.
-        Uses log values for normalization.
-        """
-        smoothness = 0.0
-        
-        for i in range(4):
-            for j in range(4):
-                if board[i][j] > 0:
-                    value = math.log2(board[i][j])
-                    
-                    # Compare with right neighbor
-                    if j < 3 and board[i][j+1] > 0:
-                        smoothness -= abs(value - math.log2(board[i][j+1]))
-                    
-                    # Compare with bottom neighbor
-                    if i < 3 and board[i+1][j] > 0:
-                        smoothness -= abs(value - math.log2(board[i+1][j]))
-        
-        return smoothness
-    
     def get_stats(self):
         """Return statistics about the last search"""
         return {
@@ -265,28 +554,37 @@ class ExpectimaxAgent:
 
 class GreedyAgent:
     """Baseline greedy agent for comparison (always picks move with highest immediate score)"""
-    
+
+    def __init__(self):
+        # Same stats attributes as ExpectimaxAgent so the runner can read
+        # them directly without going through get_stats()
+        self.nodes_explored = 0
+        self.time_taken = 0
+
     def get_best_move(self, game):
         """Choose move that gives highest immediate score"""
-        available_moves = game.get_available_moves()
-        if not available_moves:
+        move_results = game.get_move_results()
+        if not move_results:
             return None
-        
+
         best_move = None
         best_score = float('-inf')
-        
-        for move in available_moves:
-            test_game = game.clone()
-            _, points = test_game.move(move)
-            
+
+        # Try each precomputed result on the live game and restore the
+        # board afterwards - no cloning per move
+        saved_board = game.board
+        for move, new_board, points in move_results:
+            game.board = new_board
+
             # Simple evaluation: immediate points + empty cells
-            empty = sum(1 for row in test_game.board for cell in row if cell == 0)
+            empty = game.count_empty()
             score = points + empty * 100
-            
+
             if score > best_score:
                 best_score = score
                 best_move = move
-        
+
+        game.board = saved_board
         return best_move
     
     def get_stats(self):
@@ -0,0 +1,213 @@
+"""
+Numba-compiled Expectimax search kernel.
+
+Once the board is a packed uint64 and the move/heuristic tables are
+precomputed, the whole recursion is integer/float arithmetic - exactly the
+shape of code Numba's @njit handles well. This module mirrors the search in
+expectimax_agent.py as free functions over (board, depth, is_max) so the
+interpreter is out of the loop entirely.
+
+Differences from the pure-Python path: chance nodes expand every empty cell
+(the exact expectation) instead of sampling, and the transposition table is
+a numba.typed.Dict keyed by the board with the searched depth stored
+alongside the value.
+
+Importing this module requires numba; expectimax_agent falls back to the
+pure-Python search when it is unavailable.
+"""
+
+import numpy as np
+from numba import njit
+from numba import types
+from numba.typed import Dict
+
+import game
+from expectimax_agent import (ROW_EMPTY_TABLE, ROW_MAX_TABLE,
+                              ROW_MONO_LEFT_TABLE, ROW_MONO_RIGHT_TABLE,
+                              ROW_SMOOTH_TABLE)
+
+# Tables as typed ndarrays so Numba treats them as constant globals
+_LEFT = np.array(game.ROW_LEFT_TABLE, dtype=np.uint16)
+_RIGHT = np.array(game.ROW_RIGHT_TABLE, dtype=np.uint16)
+_EMPTY = np.array(ROW_EMPTY_TABLE, dtype=np.int8)
+_MAX = np.array(ROW_MAX_TABLE, dtype=np.int8)
+_MONO_L = np.array(ROW_MONO_LEFT_TABLE, dtype=np.float64)
+_MONO_R = np.array(ROW_MONO_RIGHT_TABLE, dtype=np.float64)
+_SMOOTH = np.array(ROW_SMOOTH_TABLE, dtype=np.float64)
+
+_ROW_MASK = np.uint64(0xFFFF)
+_NIB_MASK = np.uint64(0xF)
+
+# Cache only nodes at least this deep (see ExpectimaxAgent.CACHE_DEPTH_LIMIT)
+CACHE_DEPTH_LIMIT = 2
+
+
+def new_cache():
+    """Create an empty transposition table: board -> (depth, value)"""
+    return Dict.empty(key_type=types.uint64,
+                      value_type=types.UniTuple(types.float64, 2))
+
+
+@njit(cache=True)
+def _transpose(b):
+    a1 = b & np.uint64(0xF0F00F0FF0F00F0F)
+    a2 = b & np.uint64(0x0000F0F00000F0F0)
+    a3 = b & np.uint64(0x0F0F00000F0F0000)
+    a = a1 | (a2 << np.uint64(12)) | (a3 >> np.uint64(12))
+    b1 = a & np.uint64(0xFF00FF0000FF00FF)
+    b2 = a & np.uint64(0x00FF00FF00000000)
+    b3 = a & np.uint64(0x00000000FF00FF00)
+    return b1 | (b2 >> np.uint64(24)) | (b3 << np.uint64(24))
+
+
+@njit(cache=True)
+def _move(board, direction):
+    """Apply a move to the packed board. Returns the new board."""
+    if direction == 0 or direction == 2:
+        board = _transpose(board)
+    result = np.uint64(0)
+    use_right = (direction == 1 or direction == 2)
+    for i in range(4):
+        row = (board >> np.uint64(16 * i)) & _ROW_MASK
+        if use_right:
+            new_row = _RIGHT[row]
+        else:
+            new_row = _LEFT[row]
+        result |= np.uint64(new_row) << np.uint64(16 * i)
+    if direction == 0 or direction == 2:
+        result = _transpose(result)
+    return result
+
+
+@njit(cache=True)
+def _evaluate(board):
+    """Table-driven heuristic, mirroring ExpectimaxAgent._evaluate"""
+    t = _transpose(board)
+    r0 = board & _ROW_MASK
+    r1 = (board >> np.uint64(16)) & _ROW_MASK
+    r2 = (board >> np.uint64(32)) & _ROW_MASK
+    r3 = (board >> np.uint64(48)) & _ROW_MASK
+    c0 = t & _ROW_MASK
+    c1 = (t >> np.uint64(16)) & _ROW_MASK
+    c2 = (t >> np.uint64(32)) & _ROW_MASK
+    c3 = (t >> np.uint64(48)) & _ROW_MASK
+
+    empty = int(_EMPTY[r0]) + int(_EMPTY[r1]) + int(_EMPTY[r2]) + int(_EMPTY[r3])
+
+    if empty > 10:
+        w_empty, w_mono, w_smooth = 150000.0, 3000.0, 3000.0
+    elif empty > 6:
+        w_empty, w_mono, w_smooth = 200000.0, 8000.0, 2000.0
+    else:
+        w_empty, w_mono, w_smooth = 300000.0, 15000.0, 1000.0
+
+    score = w_empty * empty * empty
+
+    mono_left = _MONO_L[r0] + _MONO_L[r1] + _MONO_L[r2] + _MONO_L[r3]
+    mono_right = _MONO_R[r0] + _MONO_R[r1] + _MONO_R[r2] + _MONO_R[r3]
+    mono_up = _MONO_L[c0] + _MONO_L[c1] + _MONO_L[c2] + _MONO_L[c3]
+    mono_down = _MONO_R[c0] + _MONO_R[c1] + _MONO_R[c2] + _MONO_R[c3]
+    score += w_mono * (max(mono_up, mono_down) + max(mono_left, mono_right))
+
+    score += w_smooth * (_SMOOTH[r0] + _SMOOTH[r1] + _SMOOTH[r2] + _SMOOTH[r3] +
+                         _SMOOTH[c0] + _SMOOTH[c1] + _SMOOTH[c2] + _SMOOTH[c3])
+
+    max_exp = max(max(int(_MAX[r0]), int(_MAX[r1])),
+                  max(int(_MAX[r2]), int(_MAX[r3])))
+    if max_exp > 0:
+        score += 2000.0 * max_exp
+
+    if (max_exp == int(board & _NIB_MASK) or
+            max_exp == int((board >> np.uint64(12)) & _NIB_MASK) or
+            max_exp == int((board >> np.uint64(48)) & _NIB_MASK) or
+            max_exp == int((board >> np.uint64(60)) & _NIB_MASK)):
+        score += 5000.0
+
+    return score
+
+
+@njit(cache=True)
+def _is_game_over(board):
+    t = _transpose(board)
+    for i in range(4):
+        row = (board >> np.uint64(16 * i)) & _ROW_MASK
+        if _LEFT[row] != row or _RIGHT[row] != row:
+            return False
+        col = (t >> np.uint64(16 * i)) & _ROW_MASK
+        if _LEFT[col] != col or _RIGHT[col] != col:
+            return False
+    return True
+
+
+# No cache=True here: numba serializes the recursive self-call as an
+# unresolved symbol, so a reloaded cache entry aborts the process with an
+# LLVM "Symbol not found" error. The leaf kernels above stay cached.
+@njit
+def _expectimax(board, depth, is_max, tt, counter):
+    """Recursive Expectimax over the packed board. Returns expected utility."""
+    board = np.uint64(board)
+    counter[0] += 1
+
+    if depth == 0 or _is_game_over(board):
+        return _evaluate(board)
+
+    cacheable = depth >= CACHE_DEPTH_LIMIT and not is_max
+    if cacheable and board in tt:
+        cached_depth, cached_value = tt[board]
+        if cached_depth >= depth:
+            return cached_value
+
+    if is_max:
+        value = -1.0e308
+        for direction in range(4):
+            child = _move(board, direction)
+            if child != board:
+                score = _expectimax(child, depth - 1, False, tt, counter)
+                if score > value:
+                    value = score
+        if value == -1.0e308:
+            value = _evaluate(board)
+    else:
+        total = 0.0
+        cells = 0
+        for k in range(16):
+            shift = np.uint64(4 * k)
+            if (board >> shift) & _NIB_MASK == np.uint64(0):
+                with_2 = board | (np.uint64(1) << shift)
+                with_4 = board | (np.uint64(2) << shift)
+                total += 0.9 * _expectimax(with_2, depth - 1, True, tt, counter)
+                total += 0.1 * _expectimax(with_4, depth - 1, True, tt, counter)
+                cells += 1
+        if cells == 0:
+            value = _evaluate(board)
+        else:
+            value = total / cells
+
+    if cacheable:
+        tt[board] = (float(depth), value)
+    return value
+
+
+def search(board, depth):
+    """
+    Run a full Expectimax search from the given packed board.
+
+    Returns:
+        (best_move, nodes_explored); best_move is None if no move is legal
+    """
+    tt = new_cache()
+    counter = np.zeros(1, dtype=np.int64)
+    root = np.uint64(board)
+    best_move = None
+    best_score = float('-inf')
+    for direction in range(4):
+        child = _move(root, direction)
+        if child != root:
+            # _move unboxes to a Python int here; re-wrap so numba types
+            # the argument as uint64 (int64 overflows once the top nibble
+            # holds a tile >= 256)
+            score = _expectimax(np.uint64(child), depth - 1, False, tt, counter)
+            if score > best_score:
+                best_score = score
+                best_move = direction
+    return best_move, int(counter[0])
@@ -1,47 +1,162 @@
 import random
-import copy
+
+# ---------------------------------------------------------------------------
+# Bitboard representation
+#
+# The 4x4 board is packed into a single 64-bit integer: each tile occupies a
+# 4-bit nibble holding log2(tile) (0 = empty, 1 = tile 2, ..., 15 = tile 32768).
+# Cell (i, j) lives at bits [4*(4*i + j) .. 4*(4*i + j) + 3], so row i is the
+# 16-bit slice at bits [16*i .. 16*i + 15] with column 0 in the low nibble.
+# This makes clone a plain integer copy and moves simple table lookups.
+# ---------------------------------------------------------------------------
+
+# The bitboard is inherently 4x4; `size` survives only as a public attribute
+SIZE = 4
+
+ROW_MASK = 0xFFFF
+
+# Per-row move tables indexed by a packed 16-bit row: result of sliding the
+# row left/right and the points earned by the merges.
+ROW_LEFT_TABLE = [0] * 65536
+ROW_RIGHT_TABLE = [0] * 65536
+ROW_SCORE_TABLE = [0] * 65536
+ROW_RIGHT_SCORE_TABLE = [0] * 65536
+
+
+def _reverse_row(row):
+    """Reverse the 4 nibbles of a packed 16-bit row"""
+    return ((row >> 12) & 0xF) | ((row >> 4) & 0xF0) | \
+           ((row << 4) & 0xF00) | ((row << 12) & 0xF000)
+
+
+def _build_move_tables():
+    """Precompute the slide/merge result and score for every possible row"""
+    for row in range(65536):
+        tiles = [(row >> (4 * j)) & 0xF for j in range(4)]
+        # Compress: drop empty cells
+        compressed = [t for t in tiles if t != 0]
+        # Merge adjacent equal exponents (left to right)
+        merged = []
+        points = 0
+        skip = False
+        for j in range(len(compressed)):
+            if skip:
+                skip = False
+                continue
+            if j + 1 < len(compressed) and compressed[j] == compressed[j + 1]:
+                exp = min(compressed[j] + 1, 15)
+                merged.append(exp)
+                points += 2 ** (compressed[j] + 1)
+                skip = True
+            else:
+                merged.append(compressed[j])
+        # Pad with zeros and repack
+        merged += [0] * (4 - len(merged))
+        packed = merged[0] | (merged[1] << 4) | (merged[2] << 8) | (merged[3] << 12)
+        ROW_LEFT_TABLE[row] = packed
+        ROW_SCORE_TABLE[row] = points
+
+    for row in range(65536):
+        rev = _reverse_row(row)
+        ROW_RIGHT_TABLE[row] = _reverse_row(ROW_LEFT_TABLE[rev])
+        ROW_RIGHT_SCORE_TABLE[row] = ROW_SCORE_TABLE[rev]
+
+
+_build_move_tables()
+
+
+def transpose(board):
+    """Transpose a packed board (swap rows and columns) via bit shuffles"""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def unpack_board(board):
+    """Unpack a 64-bit board into a 2D list of tile values"""
+    grid = []
+    for i in range(4):
+        row = []
+        for j in range(4):
+            exp = (board >> (4 * (4 * i + j))) & 0xF
+            row.append(2 ** exp if exp else 0)
+        grid.append(row)
+    return grid
+
 
 class Game2048:
-    """Core 2048 game logic"""
-    
-    def __init__(self, size=4):
-        self.size = size
-        self.board = [[0] * size for _ in range(size)]
+    """Core 2048 game logic (board packed into a 64-bit integer)"""
+
+    def __init__(self, size=SIZE):
+        if size != SIZE:
+            raise ValueError("bitboard representation supports only 4x4 boards")
+        self.size = SIZE
+        self.board = 0
         self.score = 0
         self.add_random_tile()
         self.add_random_tile()
-    
+
+    def get_tile(self, i, j):
+        """Return the tile value at (i, j), 0 if empty"""
+        exp = (self.board >> (4 * (4 * i + j))) & 0xF
+        return 2 ** exp if exp else 0
+
+    def set_tile(self, i, j, value):
+        """Set the tile at (i, j) to the given value (0 clears the cell)"""
+        shift = 4 * (4 * i + j)
+        exp = value.bit_length() - 1 if value else 0
+        self.board = (self.board & ~(0xF << shift)) | (exp << shift)
+
+    def get_grid(self):
+        """Return the board as a 2D list of tile values"""
+        return unpack_board(self.board)
+
     def add_random_tile(self):
         """Add a random tile (2 with 90% probability, 4 with 10%)"""
-        empty_cells = [(i, j) for i in range(self.size) 
-                       for j in range(self.size) if self.board[i][j] == 0]
+        empty_cells = self.get_empty_cells()
         if empty_cells:
             i, j = random.choice(empty_cells)
-            self.board[i][j] = 2 if random.random() < 0.9 else 4
+            self.set_tile(i, j, 2 if random.random() < 0.9 else 4)
             return True
         return False
-    
+
     def get_empty_cells(self):
         """Return list of empty cell coordinates"""
-        return [(i, j) for i in range(self.size) 
-                for j in range(self.size) if self.board[i][j] == 0]
-    
+        board = self.board
+        return [(i, j) for i in range(4) for j in range(4)
+                if not (board >> (4 * (4 * i + j))) & 0xF]
+
+    def count_empty(self):
+        """Return the number of empty cells"""
+        board = self.board
+        count = 0
+        for k in range(16):
+            if not (board >> (4 * k)) & 0xF:
+                count += 1
+        return count
+
     def clone(self):
-        """Create a deep copy of the game state"""
-        new_game = Game2048(self.size)
-        new_game.board = copy.deepcopy(self.board)
+        """Create a copy of the game state"""
+        new_game = Game2048.__new__(Game2048)
+        new_game.size = SIZE
+        new_game.board = self.board
         new_game.score = self.score
         return new_game
-    
+
     def move(self, direction):
         """
         Attempt to move in the given direction.
         Returns (success, points_earned)
         Directions: 0=UP, 1=RIGHT, 2=DOWN, 3=LEFT
         """
-        original = copy.deepcopy(self.board)
+        original = self.board
         points = 0
-        
+
         if direction == 0:  # UP
             points = self._move_up()
         elif direction == 1:  # RIGHT
@@ -50,89 +165,138 @@ class Game2048:
             points = self._move_down()
         elif direction == 3:  # LEFT
             points = self._move_left()
-        
+
         moved = (original != self.board)
         if moved:
             self.score += points
-        
+
         return moved, points
-    
+
     def _move_left(self):
-        """Move all tiles left and merge"""
+        """Move all tiles left and merge (one table lookup per row)"""
+        board = self.board
+        result = 0
         points = 0
-        for i in range(self.size):
-            # Compress: move all non-zero tiles left
-            row = [x for x in self.board[i] if x != 0]
-            # Merge adjacent equal tiles
-            merged = []
-            skip = False
-            for j in range(len(row)):
-                if skip:
-                    skip = False
-                    continue
-                if j + 1 < len(row) and row[j] == row[j + 1]:
-                    merged.append(row[j] * 2)
-                    points += row[j] * 2
-                    skip = True
-                else:
-                    merged.append(row[j])
-            # Pad with zeros
-            merged += [0] * (self.size - len(merged))
-            self.board[i] = merged
+        for i in range(4):
+            row = (board >> (16 * i)) & ROW_MASK
+            result |= ROW_LEFT_TABLE[row] << (16 * i)
+            points += ROW_SCORE_TABLE[row]
+        self.board = result
         return points
-    
+
     def _move_right(self):
         """Move all tiles right and merge"""
-        self._reverse_board()
-        points = self._move_left()
-        self._reverse_board()
+        board = self.board
+        result = 0
+        points = 0
+        for i in range(4):
+            row = (board >> (16 * i)) & ROW_MASK
+            result |= ROW_RIGHT_TABLE[row] << (16 * i)
+            points += ROW_RIGHT_SCORE_TABLE[row]
+        self.board = result
         return points
-    
+
     def _move_up(self):
         """Move all tiles up and merge"""
-        self._transpose_board()
+        self.board = transpose(self.board)
         points = self._move_left()
-        self._transpose_board()
+        self.board = transpose(self.board)
         return points
-    
+
     def _move_down(self):
         """Move all tiles down and merge"""
-        self._transpose_board()
+        self.board = transpose(self.board)
         points = self._move_right()
-        self._transpose_board()
+        self.board = transpose(self.board)
         return points
-    
-    def _transpose_board(self):
-        """Transpose the board (swap rows and columns)"""
-        self.board = [list(row) for row in zip(*self.board)]
-    
-    def _reverse_board(self):
-        """Reverse each row of the board"""
-        self.board = [row[::-1] for row in self.board]
-    
+
+    def get_move_results(self):
+        """
+        Try all four directions once, without cloning.
+        Returns [(direction, new_board, points), ...] for the legal moves.
+        """
+        board = self.board
+        t = transpose(board)
+        up_board = right_board = down_board = left_board = 0
+        up_pts = right_pts = down_pts = left_pts = 0
+        for i in range(4):
+            shift = 16 * i
+            row = (board >> shift) & ROW_MASK
+            col = (t >> shift) & ROW_MASK
+            left_board |= ROW_LEFT_TABLE[row] << shift
+            left_pts += ROW_SCORE_TABLE[row]
+            right_board |= ROW_RIGHT_TABLE[row] << shift
+            right_pts += ROW_RIGHT_SCORE_TABLE[row]
+            up_board |= ROW_LEFT_TABLE[col] << shift
+            up_pts += ROW_SCORE_TABLE[col]
+            down_board |= ROW_RIGHT_TABLE[col] << shift
+            down_pts += ROW_RIGHT_SCORE_TABLE[col]
+        up_board = transpose(up_board)
+        down_board = transpose(down_board)
+
+        results = []
+        if up_board != board:
+            results.append((0, up_board, up_pts))
+        if right_board != board:
+            results.append((1, right_board, right_pts))
+        if down_board != board:
+            results.append((2, down_board, down_pts))
+        if left_board != board:
+            results.append((3, left_board, left_pts))
+        return results
+
     def get_available_moves(self):
-        """Return list of valid move directions"""
-        moves = []
-        for direction in range(4):
-            test_game = self.clone()
-            moved, _ = test_game.move(direction)
-            if moved:
-                moves.append(direction)
-        return moves
-    
+        """Return list of valid move directions (read-only table check)"""
+        board = self.board
+        t = transpose(board)
+        up = right = down = left = False
+        for i in range(4):
+            row = (board >> (16 * i)) & ROW_MASK
+            col = (t >> (16 * i)) & ROW_MASK
+            if ROW_LEFT_TABLE[row] != row:
+                left = True
+            if ROW_RIGHT_TABLE[row] != row:
+                right = True
+            if ROW_LEFT_TABLE[col] != col:
+                up = True
+            if ROW_RIGHT_TABLE[col] != col:
+                down = True
+        return [d for d, ok in enumerate((up, right, down, left)) if ok]
+
     def is_game_over(self):
-        """Check if no moves are available"""
-        return len(self.get_available_moves()) == 0
-    
+        """Check if no moves are available, without cloning or moving"""
+        board = self.board
+        # Any empty nibble means a move exists (SWAR zero-nibble test)
+        if ((board - 0x1111111111111111) & ~board
+                & 0x8888888888888888) != 0:
+            return False
+        # Full board: a direction is legal iff some row/column changes,
+        # which on a full board means an adjacent equal pair exists
+        t = transpose(board)
+        for i in range(4):
+            row = (board >> (16 * i)) & ROW_MASK
+            if ROW_LEFT_TABLE[row] != row:
+                return False
+            col = (t >> (16 * i)) & ROW_MASK
+            if ROW_LEFT_TABLE[col] != col:
+                return False
+        return True
+
     def get_max_tile(self):
         """Return the maximum tile value on the board"""
-        return max(max(row) for row in self.board)
-    
+        board = self.board
+        max_exp = 0
+        for k in range(16):
+            exp = (board >> (4 * k)) & 0xF
+            if exp > max_exp:
+                max_exp = exp
+        return 2 ** max_exp if max_exp else 0
+
     def __str__(self):
         """String representation of the board"""
         s = f"Score: {self.score}\n"
-        s += "-" * (self.size * 6 + 1) + "\n"
-        for row in self.board:
+        s += "-" * (SIZE * 6 + 1) + "\n"
+        for row in self.get_grid():
             s += "|" + "|".join(f"{cell:5}" if cell else "     " for cell in row) + "|\n"
-        s += "-" * (self.size * 6 + 1)
-        return s
\ No newline at end of file
+        s += "-" * (SIZE * 6 + 1)
+        return s
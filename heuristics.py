@@ -1,40 +1,231 @@
-import math
+import collections
+import functools
+
+import numpy as np
+
+try:
+    import heuristics_c  # compiled extension (python setup.py build_ext --inplace)
+except ImportError:
+    heuristics_c = None
+
+try:
+    import heuristics_nb
+except ImportError:  # numba not installed - pure-Python fallback below
+    heuristics_nb = None
+
+# Tile values are exact powers of two, so log2 is a table lookup: LOG2[v]
+# holds log2(v) for v = 1, 2, 4, ..., 2**17 (0 elsewhere)
+LOG2 = [0] * (1 << 18)
+_v = 1
+for _k in range(18):
+    LOG2[_v] = _k
+    _v <<= 1
+
+# Flat-index neighbor pairs for single-loop traversals of the 4x4 grid
+RIGHT_PAIRS = tuple((k, k + 1) for k in range(16) if k % 4 != 3)
+DOWN_PAIRS = tuple((k, k + 4) for k in range(12))
+
+# Snake-ordered positional weights: largest in the top-left corner,
+# decreasing along a boustrophedon path to the bottom-right. A single dot
+# product against these rewards both corner placement and monotonic order.
+SNAKE_WEIGHTS = tuple(4 ** e for e in (15, 14, 13, 12,
+                                       8, 9, 10, 11,
+                                       7, 6, 5, 4,
+                                       0, 1, 2, 3))
+
+# Heuristic weights as a namedtuple: attribute access instead of repeated
+# dict hashing, and (being a tuple) directly usable as a cache key
+Weights = collections.namedtuple('Weights', 'empty mono smooth max corner')
+
+DEFAULT_WEIGHTS = Weights(empty=10.0, mono=4.0, smooth=0.5,
+                          max=2.0, corner=1.0)
+
 
 class Heuristics:
     """Collection of heuristic evaluation functions for 2048 board states"""
-    
+
+    @staticmethod
+    def _encode(board):
+        """
+        Pack a 2D board into a 64-bit integer, one 4-bit nibble per cell
+        holding log2(tile) (0 for empty). Cell (i, j) sits at bit
+        4*(4*i + j), matching the game's bitboard layout.
+        """
+        b = 0
+        k = 0
+        for row in board:
+            for v in row:
+                if v:
+                    b |= (v.bit_length() - 1) << (4 * k)
+                k += 1
+        return b
+
+    @staticmethod
+    def _to_log_board(board):
+        """
+        Convert a value board to a tuple-of-tuples of log2 exponents
+        (0 = empty). All magnitude-based heuristics can then work in pure
+        small-int arithmetic with no per-cell log conversion.
+        """
+        return tuple(tuple(LOG2[v] for v in row) for row in board)
+
+    @staticmethod
+    def _as_bytes(board):
+        """
+        Flatten a value board into 16 bytes of log2 exponents (0 = empty).
+        bytes indexes to small ints with no pointer chasing, and its C-level
+        reductions (count, max) beat any Python loop.
+        """
+        return bytes(LOG2[v] for row in board for v in row)
+
+    @staticmethod
+    def _decode(b):
+        """Unpack an encoded board back into a 2D list of tile values"""
+        return [[(2 ** exp if exp else 0)
+                 for exp in ((b >> (4 * (4 * i + j))) & 0xF for j in range(4))]
+                for i in range(4)]
+
+    @staticmethod
+    def _max_exp_u64(b):
+        """Maximum nibble (= log2 of the maximum tile) of an encoded board"""
+        return max((b >> (4 * k)) & 0xF for k in range(16))
+
+    @staticmethod
+    def _corner_bonus_u64(b):
+        """Corner bonus on an encoded board: nibbles at fixed shifts"""
+        max_exp = Heuristics._max_exp_u64(b)
+        if max_exp in ((b >> 0) & 0xF, (b >> 12) & 0xF,
+                       (b >> 48) & 0xF, (b >> 60) & 0xF):
+            return 20000
+        return 0
+
+    @staticmethod
+    def build_weights(weights):
+        """
+        Normalize weights to a Weights namedtuple. Accepts an existing
+        Weights, the legacy dict form ('empty_tiles', 'monotonicity', ...)
+        or None for the defaults.
+        """
+        if weights is None:
+            return DEFAULT_WEIGHTS
+        if isinstance(weights, Weights):
+            return weights
+        return Weights(empty=weights['empty_tiles'],
+                       mono=weights['monotonicity'],
+                       smooth=weights['smoothness'],
+                       max=weights['max_tile'],
+                       corner=weights.get('corner_bonus', 1.0))
+
     @staticmethod
     def evaluate(board, weights=None):
         """
         Combined heuristic evaluation of a board state.
         Higher scores indicate better positions.
-        
+
         Args:
             board: 2D list representing the game board
-            weights: Dict of weights for each heuristic component
+            weights: Weights namedtuple (or legacy dict of weights)
         """
-        if weights is None:
-            weights = {
-                'empty_tiles': 10.0,
-                'monotonicity': 4.0,
-                'smoothness': 0.5,
-                'max_tile': 2.0,
-                'corner_bonus': 1.0
-            }
-        
-        score = 0
-        score += weights['empty_tiles'] * Heuristics.empty_tiles(board)
-        score += weights['monotonicity'] * Heuristics.monotonicity(board)
-        score += weights['smoothness'] * Heuristics.smoothness(board)
-        score += weights['max_tile'] * Heuristics.max_tile_score(board)
-        score += weights.get('corner_bonus', 1.0) * Heuristics.corner_bonus(board)
-        
-        return score
-    
+        w = Heuristics.build_weights(weights)
+        return Heuristics._evaluate_encoded(Heuristics._encode(board), w)
+
+    @staticmethod
+    def evaluate_u64(b, weights=None):
+        """
+        Evaluate an already-encoded 64-bit board (same nibble layout as
+        game.py's bitboard). Callers that hold the packed board - the
+        search sits on one at every leaf - skip the 2D-list round trip
+        and all five components share the single 8-byte value.
+        """
+        return Heuristics._evaluate_encoded(b, Heuristics.build_weights(weights))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1048576)
+    def _evaluate_encoded(b, w):
+        """
+        Memoized evaluation keyed on the encoded board and a Weights tuple.
+        Search re-scores the same positions constantly (transpositions and
+        repeated leaves), so repeated calls become a dict probe.
+        """
+        if heuristics_c is not None:
+            return heuristics_c.evaluate_c(
+                b, w.empty, w.mono, w.smooth, w.max, w.corner)
+
+        if heuristics_nb is not None:
+            exps = np.zeros(16, dtype=np.int8)
+            for k in range(16):
+                exps[k] = (b >> (4 * k)) & 0xF
+            return heuristics_nb.evaluate_nb(
+                exps, w.empty, w.mono, w.smooth, w.max, w.corner)
+
+        return Heuristics.evaluate_fused(Heuristics._decode(b), w)
+
+    @staticmethod
+    def clear_cache():
+        """Drop memoized evaluations (call between games to bound memory)"""
+        Heuristics._evaluate_encoded.cache_clear()
+
+    @staticmethod
+    def evaluate_fused(board, weights=None):
+        """
+        Single-pass equivalent of evaluate: one traversal of the grid
+        accumulates empty count, monotonicity deltas, smoothness, the max
+        tile, and the corner check, instead of five separate walks.
+        """
+        # Hoist weight lookups (and the log table) out of the loop
+        w = Heuristics.build_weights(weights)
+        w_empty = w.empty
+        w_mono = w.mono
+        w_smooth = w.smooth
+        w_max = w.max
+        w_corner = w.corner
+        log2 = LOG2
+
+        empties = 0
+        max_tile = 0
+        up = down = left = right = 0
+        smoothness = 0.0
+
+        for i in range(4):
+            row = board[i]
+            for j in range(4):
+                v = row[j]
+                if v == 0:
+                    empties += 1
+                    continue
+                if v > max_tile:
+                    max_tile = v
+                value = log2[v]
+                if j < 3:
+                    r = row[j + 1]
+                    if r != 0:
+                        smoothness -= abs(value - log2[r])
+                        # Branchless: max(d, 0) instead of an if/else pair
+                        d = v - r
+                        left += max(d, 0)
+                        right += max(-d, 0)
+                if i < 3:
+                    d = board[i + 1][j]
+                    if d != 0:
+                        smoothness -= abs(value - log2[d])
+                        d -= v
+                        down += max(d, 0)
+                        up += max(-d, 0)
+
+        mono = max(up, down) + max(left, right)
+        corner = 20000 if max_tile in (board[0][0], board[0][3],
+                                       board[3][0], board[3][3]) else 0
+
+        return (w_empty * empties * empties +
+                w_mono * mono +
+                w_smooth * smoothness +
+                w_max * (log2[max_tile] if max_tile else 0) +
+                w_corner * corner)
+
     @staticmethod
     def empty_tiles(board):
         """Count empty tiles - more empty tiles is better"""
-        count = sum(1 for row in board for cell in row if cell == 0)
+        count = Heuristics._as_bytes(board).count(0)  # single C call
         return count ** 2  # Square to emphasize importance
     
     @staticmethod
@@ -42,34 +233,39 @@ class Heuristics:
         """
         Measure how monotonic the board is (tiles increase/decrease in order).
         Snake pattern: high values in corners, decreasing toward opposite corner.
+
+        Vectorized: the 24 neighbor comparisons become four masked SIMD
+        reductions over the difference arrays (pairs touching an empty cell
+        contribute nothing, as before).
         """
-        size = len(board)
-        totals = [0, 0, 0, 0]  # up, down, left, right
-        
-        # Check rows (left and right)
-        for row in board:
-            current_left = 0
-            current_right = 0
-            for j in range(size - 1):
-                if row[j] != 0 and row[j+1] != 0:
-                    current_left += (row[j] - row[j+1]) if row[j] > row[j+1] else 0
-                    current_right += (row[j+1] - row[j]) if row[j+1] > row[j] else 0
-            totals[2] += current_left
-            totals[3] += current_right
-        
-        # Check columns (up and down)
-        for j in range(size):
-            current_up = 0
-            current_down = 0
-            for i in range(size - 1):
-                if board[i][j] != 0 and board[i+1][j] != 0:
-                    current_up += (board[i][j] - board[i+1][j]) if board[i][j] > board[i+1][j] else 0
-                    current_down += (board[i+1][j] - board[i][j]) if board[i+1][j] > board[i][j] else 0
-            totals[0] += current_up
-            totals[1] += current_down
-        
-        return max(totals[0], totals[1]) + max(totals[2], totals[3])
+        A = np.asarray(board, dtype=np.float64)
+        mask = A > 0
+
+        # Rows (left and right)
+        row_pair = mask[:, :-1] & mask[:, 1:]
+        dh = np.where(row_pair, A[:, :-1] - A[:, 1:], 0.0)
+        left = np.maximum(dh, 0.0).sum()
+        right = np.maximum(-dh, 0.0).sum()
+
+        # Columns (up and down)
+        col_pair = mask[:-1, :] & mask[1:, :]
+        dv = np.where(col_pair, A[:-1, :] - A[1:, :], 0.0)
+        up = np.maximum(dv, 0.0).sum()
+        down = np.maximum(-dv, 0.0).sum()
+
+        return max(up, down) + max(left, right)
     
+    @staticmethod
+    def snake_score(board, W=SNAKE_WEIGHTS):
+        """
+        Dot product of the flattened board against a snake-ordered weight
+        table: 16 branchless multiply-adds that reward keeping big tiles
+        in the corner in decreasing order. A cheap positional alternative
+        to the pairwise monotonicity comparisons.
+        """
+        flat = board[0] + board[1] + board[2] + board[3]
+        return sum(W[k] * flat[k] for k in range(16))
+
     @staticmethod
     def smoothness(board):
         """
@@ -77,24 +273,25 @@ class Heuristics:
         Lower difference between adjacent tiles is better.
         Returns negative value (penalty), so higher (closer to 0) is better.
         """
-        size = len(board)
         smoothness = 0
-        
-        for i in range(size):
-            for j in range(size):
-                if board[i][j] != 0:
-                    value = math.log2(board[i][j])
-                    
-                    # Compare with right neighbor
-                    if j < size - 1 and board[i][j+1] != 0:
-                        target_value = math.log2(board[i][j+1])
-                        smoothness -= abs(value - target_value)
-                    
-                    # Compare with bottom neighbor
-                    if i < size - 1 and board[i+1][j] != 0:
-                        target_value = math.log2(board[i+1][j])
-                        smoothness -= abs(value - target_value)
-        
+
+        # Work on a flattened exponent board: each |log difference| is a
+        # plain integer subtraction over precomputed neighbor pairs (no
+        # tile has exponent 0, so truthiness doubles as the non-empty
+        # check, and one flat loop replaces the nested i/j iteration)
+        L = Heuristics._to_log_board(board)
+        flat = L[0] + L[1] + L[2] + L[3]
+        for a, b in RIGHT_PAIRS:
+            va = flat[a]
+            vb = flat[b]
+            if va and vb:
+                smoothness -= abs(va - vb)
+        for a, b in DOWN_PAIRS:
+            va = flat[a]
+            vb = flat[b]
+            if va and vb:
+                smoothness -= abs(va - vb)
+
         return smoothness
     
     @staticmethod
@@ -103,29 +300,16 @@ class Heuristics:
         Reward for having high-value tiles.
         Uses log to prevent exponential growth dominating other heuristics.
         """
-        max_tile = max(max(row) for row in board)
-        if max_tile == 0:
-            return 0
-        return math.log2(max_tile)
-    
+        # Each byte already is log2(tile), so this is one C-level max
+        return max(Heuristics._as_bytes(board))
+
     @staticmethod
     def corner_bonus(board):
         """
         Bonus for keeping the max tile in a corner.
         Helps maintain snake pattern.
         """
-        max_tile = max(max(row) for row in board)
-        size = len(board)
-        corners = [
-            board[0][0], 
-            board[0][size-1], 
-            board[size-1][0], 
-            board[size-1][size-1]
-        ]
-        
-        if max_tile in corners:
-            return 20000
-        return 0
+        return Heuristics._corner_bonus_u64(Heuristics._encode(board))
     
     @staticmethod
     def merge_potential(board):
@@ -133,17 +317,16 @@ class Heuristics:
         Count how many tiles can potentially merge.
         More merge opportunities is better.
         """
-        size = len(board)
         merge_count = 0
-        
-        for i in range(size):
-            for j in range(size):
-                if board[i][j] != 0:
-                    # Check right
-                    if j < size - 1 and board[i][j] == board[i][j+1]:
-                        merge_count += 1
-                    # Check down
-                    if i < size - 1 and board[i][j] == board[i+1][j]:
-                        merge_count += 1
-        
+
+        flat = board[0] + board[1] + board[2] + board[3]
+        # Check right
+        for a, b in RIGHT_PAIRS:
+            if flat[a] != 0 and flat[a] == flat[b]:
+                merge_count += 1
+        # Check down
+        for a, b in DOWN_PAIRS:
+            if flat[a] != 0 and flat[a] == flat[b]:
+                merge_count += 1
+
         return merge_count
\ No newline at end of file
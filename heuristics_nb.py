@@ -0,0 +1,111 @@
+"""
+Numba-compiled versions of the board heuristics.
+
+Boards are passed as flat length-16 int8 arrays of log2 exponents
+(0 = empty, 1 = tile 2, ...), so smoothness reduces to integer exponent
+differences with no math.log2 anywhere. Each function is @njit(cache=True,
+nogil=True): compiled once (cached on disk afterwards) and safe to call
+from threads without serializing on the GIL.
+
+heuristics.py imports this module when numba is installed and falls back to
+its pure-Python implementations otherwise.
+"""
+
+import numpy as np
+from numba import njit
+
+
+def to_exp_array(board):
+    """Flatten a 2D board of tile values into an int8 array of exponents"""
+    b = np.zeros(16, dtype=np.int8)
+    k = 0
+    for row in board:
+        for v in row:
+            if v:
+                b[k] = v.bit_length() - 1
+            k += 1
+    return b
+
+
+@njit(cache=True, nogil=True)
+def empty_tiles_nb(b):
+    """Squared count of empty cells"""
+    count = 0
+    for k in range(16):
+        if b[k] == 0:
+            count += 1
+    return count * count
+
+
+@njit(cache=True, nogil=True)
+def monotonicity_nb(b):
+    """Monotonicity over raw tile values, mirroring Heuristics.monotonicity"""
+    up = 0.0
+    down = 0.0
+    left = 0.0
+    right = 0.0
+    for i in range(4):
+        for j in range(3):
+            # Rows (branchless: max(d, 0) instead of an if/else pair)
+            a = b[4 * i + j]
+            c = b[4 * i + j + 1]
+            if a != 0 and c != 0:
+                d = (1 << a) - (1 << c)
+                left += max(d, 0)
+                right += max(-d, 0)
+            # Columns
+            a = b[4 * j + i]
+            c = b[4 * (j + 1) + i]
+            if a != 0 and c != 0:
+                d = (1 << a) - (1 << c)
+                up += max(d, 0)
+                down += max(-d, 0)
+    return max(up, down) + max(left, right)
+
+
+@njit(cache=True, nogil=True)
+def smoothness_nb(b):
+    """Negative sum of |log2 differences| between adjacent non-empty tiles"""
+    smoothness = 0.0
+    for i in range(4):
+        for j in range(4):
+            a = b[4 * i + j]
+            if a != 0:
+                if j < 3 and b[4 * i + j + 1] != 0:
+                    smoothness -= abs(a - b[4 * i + j + 1])
+                if i < 3 and b[4 * (i + 1) + j] != 0:
+                    smoothness -= abs(a - b[4 * (i + 1) + j])
+    return smoothness
+
+
+@njit(cache=True, nogil=True)
+def max_tile_nb(b):
+    """log2 of the maximum tile (the maximum exponent)"""
+    max_exp = 0
+    for k in range(16):
+        if b[k] > max_exp:
+            max_exp = b[k]
+    return max_exp
+
+
+@njit(cache=True, nogil=True)
+def corner_bonus_nb(b):
+    """Bonus when the maximum tile sits in a corner"""
+    max_exp = max_tile_nb(b)
+    if b[0] == max_exp or b[3] == max_exp or b[12] == max_exp or b[15] == max_exp:
+        return 20000
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def evaluate_nb(b, w_empty, w_mono, w_smooth, w_max, w_corner):
+    """Weighted combination of all five components in one compiled call"""
+    return (w_empty * empty_tiles_nb(b) +
+            w_mono * monotonicity_nb(b) +
+            w_smooth * smoothness_nb(b) +
+            w_max * max_tile_nb(b) +
+            w_corner * corner_bonus_nb(b))
+
+
+# Warm up: pay the (cached) compile cost at import instead of first use
+evaluate_nb(np.zeros(16, dtype=np.int8), 1.0, 1.0, 1.0, 1.0, 1.0)
@@ -1,18 +1,59 @@
 import json
+import os
+import random
 import time
 from datetime import datetime
+from functools import partial
+from multiprocessing import Pool
+import numpy as np
 from game import Game2048
 from expectimax_agent import ExpectimaxAgent, GreedyAgent
 from tqdm import tqdm
 
+
+def _build_agent(agent_config):
+    """Create an agent from a config dict (shared with worker processes)"""
+    if agent_config['type'] == 'expectimax':
+        return ExpectimaxAgent(**agent_config['params'])
+    elif agent_config['type'] == 'greedy':
+        return GreedyAgent()
+    else:
+        raise ValueError(f"Unknown agent type: {agent_config['type']}")
+
+
+def _seed_worker():
+    """Reseed each worker's RNG - forked children inherit the parent state,
+    so without this every worker would deal identical tiles"""
+    random.seed()
+
+
+def _play_one(agent_config, _game_index, max_moves=10000):
+    """
+    Play one game in a worker process. The agent is built inside the
+    worker so the lookup tables and caches are never pickled across
+    the process boundary; only the small config dict travels.
+    """
+    agent = _build_agent(agent_config)
+    return ExperimentRunner.run_single_game(agent, max_moves=max_moves)
+
+
 class ExperimentRunner:
     """Run experiments and collect performance data"""
     
-    def __init__(self, output_file="results.json"):
+    def __init__(self, output_file="results.jsonl"):
         self.output_file = output_file
+        # One JSON line per finished game is appended to output_file as it
+        # completes (O(N) I/O; finished games survive a crash); only the
+        # small per-experiment summary is ever rewritten in full. 'w'
+        # truncates any previous run, matching the old overwrite semantics
+        # - appending across runs would restart experiment indices at 0
+        # and make load_results merge both runs' games.
+        self.summary_file = os.path.splitext(output_file)[0] + "_summary.json"
+        self._fh = open(output_file, 'w')
         self.results = []
     
-    def run_single_game(self, agent, max_moves=10000, verbose=False):
+    @staticmethod
+    def run_single_game(agent, max_moves=10000, verbose=False):
         """
         Run a single game with the given agent.
         
@@ -39,16 +80,19 @@ class ExperimentRunner:
                 game.add_random_tile()
                 moves += 1
                 
-                # Collect stats
-                stats = agent.get_stats()
-                total_time += stats.get('time_taken', 0)
-                total_nodes += stats.get('nodes_explored', 0)
-                
-                move_history.append({
-                    'move': move,
-                    'score': game.score,
-                    'max_tile': game.get_max_tile()
-                })
+                # Collect stats: plain attribute reads, not a fresh
+                # get_stats() dict per move
+                total_time += agent.time_taken
+                total_nodes += agent.nodes_explored
+
+                # Only tracked when someone is watching: thousands of
+                # per-move dicts are dead weight in a silent run
+                if verbose:
+                    move_history.append({
+                        'move': move,
+                        'score': game.score,
+                        'max_tile': game.get_max_tile()
+                    })
         
         result = {
             'final_score': game.score,
@@ -60,10 +104,12 @@ class ExperimentRunner:
             'total_nodes': total_nodes,
             'avg_time_per_move': total_time / moves if moves > 0 else 0,
             'avg_nodes_per_move': total_nodes / moves if moves > 0 else 0,
-            'board': game.board
         }
-        
+
         if verbose:
+            # The final board matters for inspection but only bloats the
+            # results file in bulk runs
+            result['board'] = game.get_grid()
             print("\n" + "="*50)
             print("GAME OVER")
             print(game)
@@ -95,26 +141,35 @@ class ExperimentRunner:
             'games': []
         }
         
-        # Create agent based on config
-        if agent_config['type'] == 'expectimax':
-            agent = ExpectimaxAgent(**agent_config['params'])
-        elif agent_config['type'] == 'greedy':
-            agent = GreedyAgent()
+        experiment_index = len(self.results)
+
+        if verbose:
+            # Sequential fallback: interleaved board printouts from worker
+            # processes would be unreadable
+            agent = _build_agent(agent_config)
+            for i in tqdm(range(num_games), desc="Games"):
+                result = self.run_single_game(agent, verbose=verbose)
+                result['game_number'] = i + 1
+                experiment_results['games'].append(result)
+                self._append_game(experiment_index, result)
         else:
-            raise ValueError(f"Unknown agent type: {agent_config['type']}")
-        
-        # Run games with progress bar
-        for i in tqdm(range(num_games), desc="Games"):
-            result = self.run_single_game(agent, verbose=verbose)
-            result['game_number'] = i + 1
-            experiment_results['games'].append(result)
-        
+            # Games are independent, so spread them across worker processes
+            # and collect results as they finish
+            with Pool(initializer=_seed_worker) as pool:
+                jobs = pool.imap_unordered(partial(_play_one, agent_config),
+                                           range(num_games))
+                for i, result in enumerate(
+                        tqdm(jobs, total=num_games, desc="Games"), 1):
+                    result['game_number'] = i
+                    experiment_results['games'].append(result)
+                    self._append_game(experiment_index, result)
+
         # Compute aggregate statistics
         experiment_results['statistics'] = self._compute_statistics(experiment_results['games'])
-        
+
         self.results.append(experiment_results)
-        self._save_results()
-        
+        self._save_summary()
+
         return experiment_results
     
     def _compute_statistics(self, games):
@@ -122,34 +177,45 @@ class ExperimentRunner:
         if not games:
             return {}
         
-        scores = [g['final_score'] for g in games]
-        max_tiles = [g['max_tile'] for g in games]
-        moves = [g['moves'] for g in games]
-        times = [g['avg_time_per_move'] for g in games]
-        
+        # Vectorized aggregation: one array per metric, C-level reductions
+        scores = np.asarray([g['final_score'] for g in games])
+        max_tiles = np.asarray([g['max_tile'] for g in games])
+        moves = np.asarray([g['moves'] for g in games])
+        times = np.asarray([g['avg_time_per_move'] for g in games])
+
         # Count tile achievements
-        tile_counts = {}
-        for tile in [128, 256, 512, 1024, 2048, 4096, 8192]:
-            tile_counts[f'reached_{tile}'] = sum(1 for t in max_tiles if t >= tile)
-        
+        tile_counts = {f'reached_{tile}': int((max_tiles >= tile).sum())
+                       for tile in (128, 256, 512, 1024, 2048, 4096, 8192)}
+
+        n = len(games)
         return {
-            'avg_score': sum(scores) / len(scores),
-            'max_score': max(scores),
-            'min_score': min(scores),
-            'avg_max_tile': sum(max_tiles) / len(max_tiles),
-            'highest_tile': max(max_tiles),
-            'avg_moves': sum(moves) / len(moves),
-            'avg_time_per_move': sum(times) / len(times),
-            'win_rate_2048': sum(1 for g in games if g['won_2048']) / len(games),
-            'win_rate_4096': sum(1 for g in games if g['won_4096']) / len(games),
+            'avg_score': float(scores.mean()),
+            'max_score': int(scores.max()),
+            'min_score': int(scores.min()),
+            'std_score': float(scores.std()),
+            'avg_max_tile': float(max_tiles.mean()),
+            'highest_tile': int(max_tiles.max()),
+            'avg_moves': float(moves.mean()),
+            'avg_time_per_move': float(times.mean()),
+            'win_rate_2048': tile_counts['reached_2048'] / n,
+            'win_rate_4096': tile_counts['reached_4096'] / n,
             **tile_counts
         }
     
-    def _save_results(self):
-        """Save results to JSON file"""
-        with open(self.output_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        print(f"\nResults saved to {self.output_file}")
+    def _append_game(self, experiment_index, result):
+        """Append one game record as a JSON line and flush it to disk"""
+        self._fh.write(json.dumps({'experiment': experiment_index, **result}))
+        self._fh.write('\n')
+        self._fh.flush()
+
+    def _save_summary(self):
+        """Rewrite the per-experiment summary (everything but the games)"""
+        summary = [{k: v for k, v in exp.items() if k != 'games'}
+                   for exp in self.results]
+        with open(self.summary_file, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nResults saved to {self.output_file} "
+              f"(summary: {self.summary_file})")
     
     def print_summary(self, experiment_results):
         """Print a summary of experiment results"""
@@ -176,7 +242,7 @@ class ExperimentRunner:
 
 def main():
     """Run experiments with different configurations"""
-    runner = ExperimentRunner(output_file="results.json")
+    runner = ExperimentRunner(output_file="results.jsonl")
     
     # Experiment 1: Expectimax with depth 4
     print("\n### EXPERIMENT 1: Expectimax (Depth 4) ###")
@@ -0,0 +1,23 @@
+"""Build the optional Cython heuristics extension:
+
+    python setup.py build_ext --inplace
+
+Everything runs fine without it; heuristics.py falls back to pure Python
+(or numba) when the compiled module is missing.
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+extensions = [
+    Extension(
+        "heuristics_c",
+        ["heuristics_c.pyx"],
+        extra_compile_args=["-O3", "-march=native", "-funroll-loops"],
+    ),
+]
+
+setup(
+    name="game-2048-expectimax",
+    ext_modules=cythonize(extensions, language_level=3),
+)
@@ -1,159 +1,440 @@
 import json
+import os
+from multiprocessing import get_context
+
+import matplotlib
+matplotlib.use("Agg")  # non-interactive: no display, cheaper figure setup
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
-from collections import Counter
-import os
+
+# 150 dpi is plenty for exploratory result plots; pass dpi=300 through
+# generate_all_visualizations for publication-quality output
+DPI = 150
+
+# One pooled Figure reused by every plot: clearing and re-adding axes is
+# much cheaper than allocating a fresh Figure/canvas/renderer per call
+_FIG = plt.figure()
 
 RESULTS_DIR = "results"
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
-def load_results(filename="results.json"):
-    """Load experiment results from JSON file"""
-    with open(filename, 'r') as f:
-        return json.load(f)
+try:
+    import orjson
+except ImportError:  # orjson not installed - stdlib json fallback below
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson not installed - whole-document parse fallback
+    ijson = None
+
+def _loads(data):
+    """Parse one JSON document, preferring orjson's C parser when present"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+try:
+    from numba import njit
+except ImportError:  # numba not installed - numpy fallback below
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _milestone_counts(exps, out):
+        """Histogram the log2(max_tile) array into out (one compiled pass)"""
+        for e in exps:
+            out[e] += 1
+else:
+    def _milestone_counts(exps, out):
+        np.add.at(out, exps, 1)
+
+def load_results(filename="results.jsonl"):
+    """
+    Load experiment results. The runner streams one JSON line per game to
+    a .jsonl file and keeps the per-experiment aggregates in a matching
+    *_summary.json; reassemble the experiments from the two. A plain .json
+    file (the old all-in-one format) still loads as-is.
+    """
+    if filename.endswith('.json'):
+        return _load_results_json(filename)
+
+    summary_file = os.path.splitext(filename)[0] + "_summary.json"
+    if not os.path.exists(summary_file):
+        # No streamed pair on disk - fall back to a legacy results.json
+        # from before the runner switched to JSON Lines
+        legacy = os.path.splitext(filename)[0] + ".json"
+        if os.path.exists(legacy):
+            return _load_results_json(legacy)
+    with open(summary_file, 'rb') as f:
+        results = _loads(f.read())
+    for experiment in results:
+        experiment['games'] = []
+    with open(filename, 'rb') as f:
+        for line in f:
+            record = _loads(line)
+            results[record.pop('experiment')]['games'].append(record)
+    return results
+
+def _load_results_json(filename):
+    """
+    Load an old-format all-in-one results.json. With ijson available,
+    experiments are streamed one at a time and each one's games are
+    reduced to metric arrays on the spot (then dropped), so the whole
+    document - move histories included - is never resident at once.
+    """
+    if ijson is None:
+        with open(filename, 'rb') as f:
+            return _loads(f.read())
+
+    results = []
+    with open(filename, 'rb') as f:
+        for experiment in ijson.items(f, 'item', use_float=True):
+            _prepare_experiment(experiment)
+            experiment['games'] = []  # arrays carry everything the plots need
+            results.append(experiment)
+    return results
+
+def _prepare_experiment(experiment):
+    """Attach contiguous '_scores' / '_max_tiles' / '_max_tile_exps' arrays"""
+    games = experiment['games']
+    experiment['_scores'] = np.fromiter(
+        (g['final_score'] for g in games), dtype=np.float64, count=len(games))
+    experiment['_max_tiles'] = np.fromiter(
+        (g['max_tile'] for g in games), dtype=np.int64, count=len(games))
+    experiment['_max_tile_exps'] = np.log2(
+        experiment['_max_tiles']).astype(np.int64)
+    # Cache the display strings too - every plot rebuilt these per call
+    depth = experiment['agent_params'].get('depth', 'N/A')
+    experiment['_label'] = f"{experiment['agent_type']} (d={depth})"
+    experiment['_label_nl'] = experiment['_label'].replace(' (', '\n(')
+    experiment['_title'] = f"{experiment['agent_type']}\n(Depth: {depth})"
+
+def _prepare(results):
+    """
+    Attach contiguous metric arrays to each experiment once, so the plot
+    functions share a single extraction pass instead of re-walking the
+    game dicts four times. Already-prepared experiments are left untouched.
+    """
+    for experiment in results:
+        if '_scores' not in experiment:
+            _prepare_experiment(experiment)
+    return results
+
+# Set FAST_PLOTS=1 to render the bar-only charts straight through Pillow,
+# skipping matplotlib's layout/renderer stack entirely. Histograms (with
+# axvlines and legends) stay on matplotlib.
+FAST_PLOTS = bool(os.environ.get("FAST_PLOTS"))
+
+def _pil_bar_chart(size, title, group_labels, series, ylim=None):
+    """
+    Minimal grouped-bar renderer on a bare Pillow canvas: white
+    background, y-axis gridlines, grouped bars and a one-line legend.
+    Far less flexible than matplotlib, but a fraction of the cost.
+    """
+    from PIL import Image, ImageDraw
+
+    w, h = size
+    img = Image.new('RGB', size, 'white')
+    draw = ImageDraw.Draw(img)
+    left, right, top, bottom = 70, 20, 40, 50
+    plot_w = w - left - right
+    plot_h = h - top - bottom
 
-def plot_score_distributions(results, save_path=os.path.join(RESULTS_DIR, "score_distributions.png")):
+    top_value = ylim if ylim is not None else max(
+        (max(values) for _, values, _ in series), default=1) * 1.05
+    top_value = top_value or 1
+
+    draw.text((left, 12), title, fill='black')
+    # Gridlines and y labels
+    for frac in (0.0, 0.25, 0.5, 0.75, 1.0):
+        y = top + plot_h * (1 - frac)
+        draw.line([(left, y), (w - right, y)], fill='lightgray')
+        draw.text((8, y - 6), f"{top_value * frac:.0f}", fill='black')
+
+    n_groups = len(group_labels)
+    n_series = len(series)
+    group_w = plot_w / n_groups
+    bar_w = 0.8 * group_w / n_series
+    for s, (label, values, color) in enumerate(series):
+        for g, value in enumerate(values):
+            x0 = left + g * group_w + 0.1 * group_w + s * bar_w
+            bar_h = plot_h * min(value / top_value, 1.0)
+            draw.rectangle([x0, top + plot_h - bar_h, x0 + bar_w,
+                            top + plot_h], fill=color, outline='black')
+        # Legend: colored square + label, stacked top-right
+        ly = top + 4 + 14 * s
+        draw.rectangle([w - right - 150, ly, w - right - 140, ly + 10],
+                       fill=color, outline='black')
+        draw.text((w - right - 134, ly - 1), str(label), fill='black')
+
+    for g, label in enumerate(group_labels):
+        draw.text((left + g * group_w + 0.3 * group_w, top + plot_h + 8),
+                  str(label), fill='black')
+    draw.line([(left, top), (left, top + plot_h)], fill='black')
+    draw.line([(left, top + plot_h), (w - right, top + plot_h)], fill='black')
+    return img
+
+_BAR_COLORS = ('steelblue', 'green', 'orange', 'red', 'purple', 'gray')
+
+# Milestone tiles shown on the x axes and their fixed bar positions; the
+# achievement plot uses the first six (8192 is too rare to chart a rate for)
+_TILE_VALUES = np.array([128, 256, 512, 1024, 2048, 4096, 8192])
+_TILE_X = np.arange(len(_TILE_VALUES))
+
+# A 20-bin histogram is visually identical under subsampling, so cap the
+# number of scores binned per experiment in huge sweeps
+MAX_HIST_SAMPLES = 20000
+
+def _save_fig(fig, save_path, dpi):
+    """
+    Write the figure straight through its Agg canvas. Figure.savefig
+    routes through pyplot-level print_figure bookkeeping; print_png on
+    the canvas renders once and streams the PNG to the open file.
+    compress_level=1 trades a few extra KB of PNG for a much cheaper
+    zlib pass - these are throwaway result plots, not archival images.
+    """
+    fig.set_dpi(dpi)
+    canvas = FigureCanvasAgg(fig)
+    with open(save_path, 'wb') as f:
+        canvas.print_png(f, pil_kwargs={'compress_level': 1})
+    print(f"Saved: {save_path}")
+
+def _plot_score_axis(ax, experiment):
+    """Draw one experiment's score histogram on the given axis"""
+    scores = experiment['_scores']
+
+    # Reduce once up front and bin with an explicit range, then draw
+    # the precomputed bars - ax.hist would re-scan for min/max and
+    # re-bin internally
+    lo = float(scores.min())
+    hi = float(scores.max())
+    mean_score = float(scores.mean())
+    if len(scores) > MAX_HIST_SAMPLES:
+        # Mean/min/max stay exact (cheap single passes above); only
+        # the binning works on the sample. Fixed seed keeps replots
+        # reproducible.
+        scores = np.random.default_rng(0).choice(
+            scores, MAX_HIST_SAMPLES, replace=False)
+    counts, edges = np.histogram(scores, bins=20, range=(lo, hi))
+    ax.bar(edges[:-1], counts, width=np.diff(edges),
+           align='edge', edgecolor='black', alpha=0.7)
+    ax.set_xlabel('Final Score', fontsize=12)
+    ax.set_ylabel('Frequency', fontsize=12)
+    ax.set_title(experiment['_title'], fontsize=14)
+    ax.axvline(mean_score, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_score:.0f}')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+def plot_score_distributions(results, save_path=os.path.join(RESULTS_DIR, "score_distributions.png"), dpi=DPI):
     """Plot score distributions for different agent configurations"""
-    fig, axes = plt.subplots(1, len(results), figsize=(6*len(results), 5))
-    
+    _prepare(results)
+    _FIG.clear()
+    _FIG.set_size_inches(6 * len(results), 5)
+
     if len(results) == 1:
-        axes = [axes]
-    
-    for idx, experiment in enumerate(results):
-        scores = [game['final_score'] for game in experiment['games']]
-        
-        axes[idx].hist(scores, bins=20, edgecolor='black', alpha=0.7)
-        axes[idx].set_xlabel('Final Score', fontsize=12)
-        axes[idx].set_ylabel('Frequency', fontsize=12)
-        axes[idx].set_title(f"{experiment['agent_type']}\n(Depth: {experiment['agent_params'].get('depth', 'N/A')})", fontsize=14)
-        axes[idx].axvline(np.mean(scores), color='red', linestyle='--', linewidth=2, label=f'Mean: {np.mean(scores):.0f}')
-        axes[idx].legend()
-        axes[idx].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"Saved: {save_path}")
-    plt.close()
+        # Common single-agent case: one axis, no subplot grid or array
+        # unwrapping
+        _plot_score_axis(_FIG.subplots(), results[0])
+    else:
+        axes = _FIG.subplots(1, len(results))
+        for ax, experiment in zip(axes, results):
+            _plot_score_axis(ax, experiment)
+
+    # Fixed grid -> fixed margins: skips tight_layout's text-measuring
+    # renderer pass (two-line titles need the larger top margin)
+    _FIG.subplots_adjust(left=0.09, right=0.98, top=0.84, bottom=0.12,
+                         wspace=0.25)
+    _save_fig(_FIG, save_path, dpi)
 
-def plot_max_tile_distribution(results, save_path=os.path.join(RESULTS_DIR, "max_tile_distribution.png")):
+def plot_max_tile_distribution(results, save_path=os.path.join(RESULTS_DIR, "max_tile_distribution.png"), dpi=DPI):
     """Plot distribution of maximum tiles achieved"""
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    tile_values = [128, 256, 512, 1024, 2048, 4096, 8192]
-    x = np.arange(len(tile_values))
+    _prepare(results)
+    _FIG.clear()
+    _FIG.set_size_inches(12, 6)
+    ax = _FIG.subplots()
+
     width = 0.8 / len(results)
-    
+
     for idx, experiment in enumerate(results):
-        max_tiles = [game['max_tile'] for game in experiment['games']]
-        tile_counts = Counter(max_tiles)
-        
-        counts = [tile_counts[tile] for tile in tile_values]
-        label = f"{experiment['agent_type']} (d={experiment['agent_params'].get('depth', 'N/A')})"
-        
-        ax.bar(x + idx * width, counts, width, label=label, alpha=0.8)
-    
+        # Tile values are powers of two, so bucket by exponent: one C-level
+        # bincount instead of a Counter hashing every game
+        exps = experiment['_max_tile_exps']
+        counts = np.bincount(exps, minlength=14)[[7, 8, 9, 10, 11, 12, 13]]
+        offsets = _TILE_X + idx * width
+
+        ax.bar(offsets, counts, width, label=experiment['_label'], alpha=0.8)
+
     ax.set_xlabel('Maximum Tile Achieved', fontsize=12)
     ax.set_ylabel('Number of Games', fontsize=12)
     ax.set_title('Distribution of Maximum Tiles Achieved', fontsize=14)
-    ax.set_xticks(x + width * (len(results) - 1) / 2)
-    ax.set_xticklabels(tile_values)
+    ax.set_xticks(_TILE_X + width * (len(results) - 1) / 2)
+    ax.set_xticklabels(_TILE_VALUES)
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"Saved: {save_path}")
-    plt.close()
+    _FIG.subplots_adjust(left=0.07, right=0.98, top=0.92, bottom=0.10)
+    _save_fig(_FIG, save_path, dpi)
 
-def plot_performance_comparison(results, save_path=os.path.join(RESULTS_DIR, "performance_comparison.png")):
+def plot_performance_comparison(results, save_path=os.path.join(RESULTS_DIR, "performance_comparison.png"), dpi=DPI):
     """Compare key metrics across different configurations"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if FAST_PLOTS:
+        from PIL import Image
+        labels = [exp.get('_label') or
+                  f"{exp['agent_type']} (d={exp['agent_params'].get('depth', 'N/A')})"
+                  for exp in results]
+        metrics = [
+            ('Average Final Score',
+             [exp['statistics']['avg_score'] for exp in results]),
+            ('Percentage Reaching 2048 Tile',
+             [exp['statistics']['win_rate_2048'] * 100 for exp in results]),
+            ('Average Game Length (Moves)',
+             [exp['statistics']['avg_moves'] for exp in results]),
+            ('Average Time per Move (ms)',
+             [exp['statistics']['avg_time_per_move'] * 1000 for exp in results]),
+        ]
+        cell = (700, 500)
+        sheet = Image.new('RGB', (2 * cell[0], 2 * cell[1]), 'white')
+        for k, (title, values) in enumerate(metrics):
+            chart = _pil_bar_chart(cell, title, labels,
+                                   [('', values, _BAR_COLORS[k])])
+            sheet.paste(chart, ((k % 2) * cell[0], (k // 2) * cell[1]))
+        sheet.save(save_path)
+        print(f"Saved: {save_path}")
+        return
+
+    _FIG.clear()
+    _FIG.set_size_inches(14, 10)
+    axes = _FIG.subplots(2, 2)
     
-    agent_labels = [f"{exp['agent_type']}\n(d={exp['agent_params'].get('depth', 'N/A')})" 
+    agent_labels = [exp.get('_label_nl') or
+                    f"{exp['agent_type']}\n(d={exp['agent_params'].get('depth', 'N/A')})"
                     for exp in results]
-    
+
+    # One row per experiment, one column per metric: unit conversions
+    # become vector multiplies and ax.bar gets contiguous arrays instead
+    # of Python lists to re-convert
+    stats_arr = np.array([(exp['statistics']['avg_score'],
+                           exp['statistics']['win_rate_2048'],
+                           exp['statistics']['avg_moves'],
+                           exp['statistics']['avg_time_per_move'])
+                          for exp in results], dtype=np.float64)
+
     # Average Score
-    avg_scores = [exp['statistics']['avg_score'] for exp in results]
-    axes[0, 0].bar(agent_labels, avg_scores, color='steelblue', alpha=0.7)
+    axes[0, 0].bar(agent_labels, stats_arr[:, 0], color='steelblue', alpha=0.7)
     axes[0, 0].set_ylabel('Average Score', fontsize=11)
     axes[0, 0].set_title('Average Final Score', fontsize=12)
     axes[0, 0].tick_params(axis='x', rotation=15)
     axes[0, 0].grid(True, alpha=0.3, axis='y')
     
     # Win Rate (2048)
-    win_rates = [exp['statistics']['win_rate_2048'] * 100 for exp in results]
-    axes[0, 1].bar(agent_labels, win_rates, color='green', alpha=0.7)
+    axes[0, 1].bar(agent_labels, stats_arr[:, 1] * 100.0, color='green', alpha=0.7)
     axes[0, 1].set_ylabel('Win Rate (%)', fontsize=11)
     axes[0, 1].set_title('Percentage Reaching 2048 Tile', fontsize=12)
     axes[0, 1].tick_params(axis='x', rotation=15)
     axes[0, 1].grid(True, alpha=0.3, axis='y')
     
     # Average Moves
-    avg_moves = [exp['statistics']['avg_moves'] for exp in results]
-    axes[1, 0].bar(agent_labels, avg_moves, color='orange', alpha=0.7)
+    axes[1, 0].bar(agent_labels, stats_arr[:, 2], color='orange', alpha=0.7)
     axes[1, 0].set_ylabel('Average Moves', fontsize=11)
     axes[1, 0].set_title('Average Game Length (Moves)', fontsize=12)
     axes[1, 0].tick_params(axis='x', rotation=15)
     axes[1, 0].grid(True, alpha=0.3, axis='y')
     
-    # Time per Move
-    avg_times = [exp['statistics']['avg_time_per_move'] * 1000 for exp in results]  # Convert to ms
-    axes[1, 1].bar(agent_labels, avg_times, color='red', alpha=0.7)
+    # Time per Move (converted to ms)
+    axes[1, 1].bar(agent_labels, stats_arr[:, 3] * 1000.0, color='red', alpha=0.7)
     axes[1, 1].set_ylabel('Time per Move (ms)', fontsize=11)
     axes[1, 1].set_title('Average Time per Move', fontsize=12)
     axes[1, 1].tick_params(axis='x', rotation=15)
     axes[1, 1].grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"Saved: {save_path}")
-    plt.close()
+    # Extra bottom/hspace leaves room for the rotated x labels
+    _FIG.subplots_adjust(left=0.08, right=0.98, top=0.95, bottom=0.10,
+                         wspace=0.25, hspace=0.45)
+    _save_fig(_FIG, save_path, dpi)
 
-def plot_tile_achievement_rates(results, save_path=os.path.join(RESULTS_DIR, "tile_achievements.png")):
+def plot_tile_achievement_rates(results, save_path=os.path.join(RESULTS_DIR, "tile_achievements.png"), dpi=DPI):
     """Plot achievement rates for different tile milestones"""
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    tiles = [128, 256, 512, 1024, 2048, 4096]
-    x = np.arange(len(tiles))
+    _prepare(results)
+
+    if FAST_PLOTS:
+        series = []
+        for idx, experiment in enumerate(results):
+            counts = np.zeros(16, dtype=np.int64)
+            _milestone_counts(experiment['_max_tile_exps'], counts)
+            reached = np.cumsum(counts[::-1])[::-1]
+            rates = reached[[7, 8, 9, 10, 11, 12]] / experiment['num_games'] * 100
+            series.append((experiment['_label'], rates,
+                           _BAR_COLORS[idx % len(_BAR_COLORS)]))
+        img = _pil_bar_chart((1200, 600), 'Percentage of Games Reaching Each Tile',
+                             [128, 256, 512, 1024, 2048, 4096], series, ylim=105)
+        img.save(save_path)
+        print(f"Saved: {save_path}")
+        return
+
+    _FIG.clear()
+    _FIG.set_size_inches(12, 6)
+    ax = _FIG.subplots()
+
+    x = _TILE_X[:6]
     width = 0.8 / len(results)
-    
+
     for idx, experiment in enumerate(results):
-        stats = experiment['statistics']
-        rates = []
-        for tile in tiles:
-            count = stats.get(f'reached_{tile}', 0)
-            rate = (count / experiment['num_games']) * 100
-            rates.append(rate)
-        
-        label = f"{experiment['agent_type']} (d={experiment['agent_params'].get('depth', 'N/A')})"
-        ax.bar(x + idx * width, rates, width, label=label, alpha=0.8)
-    
+        # One compiled counting pass over the exponents, then a cumulative
+        # tail sum: reached[e] = number of games with max_tile >= 2**e
+        counts = np.zeros(16, dtype=np.int64)
+        _milestone_counts(experiment['_max_tile_exps'], counts)
+        reached = np.cumsum(counts[::-1])[::-1]
+        rates = reached[[7, 8, 9, 10, 11, 12]] / experiment['num_games'] * 100
+        offsets = x + idx * width
+
+        ax.bar(offsets, rates, width, label=experiment['_label'], alpha=0.8)
+
     ax.set_xlabel('Tile Value', fontsize=12)
     ax.set_ylabel('Achievement Rate (%)', fontsize=12)
     ax.set_title('Percentage of Games Reaching Each Tile', fontsize=14)
     ax.set_xticks(x + width * (len(results) - 1) / 2)
-    ax.set_xticklabels(tiles)
+    ax.set_xticklabels(_TILE_VALUES[:6])
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_ylim([0, 105])
     
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"Saved: {save_path}")
-    plt.close()
+    _FIG.subplots_adjust(left=0.07, right=0.98, top=0.92, bottom=0.10)
+    _save_fig(_FIG, save_path, dpi)
 
-def generate_all_visualizations(results_file="results.json"):
+# Name -> plotter table for dispatching work to pool workers
+_PLOTTERS = {
+    'scores': plot_score_distributions,
+    'max_tiles': plot_max_tile_distribution,
+    'performance': plot_performance_comparison,
+    'achievements': plot_tile_achievement_rates,
+}
+
+def _dispatch(name, results, dpi):
+    """Run one plotter in a worker process"""
+    _PLOTTERS[name](results, dpi=dpi)
+
+def generate_all_visualizations(results_file="results.jsonl", dpi=DPI,
+                                parallel=True):
     """Generate all visualization plots from results"""
     print("Loading results...")
-    results = load_results(results_file)
-    
+    results = _prepare(load_results(results_file))
+
     print(f"Generating visualizations for {len(results)} experiments...")
-    
-    plot_score_distributions(results)
-    plot_max_tile_distribution(results)
-    plot_performance_comparison(results)
-    plot_tile_achievement_rates(results)
-    
+
+    if parallel:
+        # The four figures are independent and CPU-bound in the Agg
+        # rasterizer, so draw them in separate processes. spawn (not fork)
+        # gives each worker a clean matplotlib state.
+        ctx = get_context("spawn")
+        with ctx.Pool(len(_PLOTTERS)) as pool:
+            pool.starmap(_dispatch,
+                         [(name, results, dpi) for name in _PLOTTERS])
+    else:
+        for name in _PLOTTERS:
+            _dispatch(name, results, dpi)
+
     print("\n✓ All visualizations generated successfully!")
 
 if __name__ == "__main__":